@@ -35,70 +35,114 @@ class PredictiveParser:
         self.debug = debug
         self.indent = 0
     
-    def log(self, message):
-        if self.debug:
-            indent = "  " * self.indent
-            print(f"{indent}{message}")
+    def log(self, message, *args):
+        """Print a trace line, %-formatting message with args if given.
+        Hot callers also check self.debug first so their arguments are not
+        built when tracing is off."""
+        if not self.debug:
+            return
+        if args:
+            message = message % args
+        indent = "  " * self.indent
+        print(f"{indent}{message}")
     
     def parse_stmt(self):
         tok = self.lexer.peek()
-        self.log(f"Parsing statement at {self.lexer.get_position()}, next token: {tok}")
+        if self.debug:
+            self.log("Parsing statement at %s, next token: %s", self.lexer.get_position(), tok)
         self.indent += 1
         
-        if tok == 'if':
+        handler = self._TABLE.get(tok)
+        if handler is not None:
+            handler(self)
+        else:
+            if self.debug:
+                self.log("Found expression statement")
+            self.parse_expr()
+            self._expect_semi()
+        
+        self.indent -= 1
+        if self.debug:
+            self.log("Statement completed")
+
+    def _parse_if(self):
+        if self.debug:
             self.log("Found 'if' statement")
-            self.lexer.next()  # consume 'if'
-            self._expect('(')
+        self.lexer.next()  # consume 'if'
+        self._expect_lparen()
+        if self.debug:
             self.log("Parsing if condition expression:")
-            self.parse_expr()
-            self._expect(')')
+        self.parse_expr()
+        self._expect_rparen()
+        if self.debug:
             self.log("Parsing if body statement:")
-            self.parse_stmt()
-            
-        elif tok == 'for':
+        self.parse_stmt()
+
+    def _parse_for(self):
+        if self.debug:
             self.log("Found 'for' statement")
-            self.lexer.next()  # consume 'for'
-            self._expect('(')
+        self.lexer.next()  # consume 'for'
+        self._expect_lparen()
+        if self.debug:
             self.log("Parsing for initialization:")
-            self.parse_optexpr()
-            self._expect(';')
+        self.parse_optexpr()
+        self._expect_semi()
+        if self.debug:
             self.log("Parsing for condition:")
-            self.parse_optexpr()
-            self._expect(')')
+        self.parse_optexpr()
+        self._expect_rparen()
+        if self.debug:
             self.log("Parsing for body statement:")
-            self.parse_stmt()
-            
-        elif tok == 'others':
+        self.parse_stmt()
+
+    def _parse_others(self):
+        if self.debug:
             self.log("Found 'others' statement")
-            self.lexer.next()  # consume 'others'
-            
-        else:
-            self.log("Found expression statement")
-            self.parse_expr()
-            self._expect(';')
-        
-        self.indent -= 1
-        self.log("Statement completed")
+        self.lexer.next()  # consume 'others'
 
     def parse_expr(self):
         tok = self.lexer.next()
         if tok is None or tok in {';', ')'}:
             raise ParserError(f'Expected expression, got {tok}')
-        self.log(f"Parsed expression token: {tok}")
+        if self.debug:
+            self.log("Parsed expression token: %s", tok)
 
     def parse_optexpr(self):
         tok = self.lexer.peek()
         if tok != ';' and tok != ')':
-            self.log("Found non-empty optional expression")
+            if self.debug:
+                self.log("Found non-empty optional expression")
             self.parse_expr()
-        else:
-            self.log(f"Found empty optional expression (ε) at {tok}")
+        elif self.debug:
+            self.log("Found empty optional expression (ε) at %s", tok)
 
-    def _expect(self, expected):
-        tok = self.lexer.next()
-        if tok != expected:
-            raise ParserError(f'Expected {expected}, got {tok}')
-        self.log(f"Matched expected token: {expected}")
+    # Statement dispatch keyed on the lookahead token
+    _TABLE = {
+        'if': _parse_if,
+        'for': _parse_for,
+        'others': _parse_others,
+    }
+
+# Specialized _expect_<name>() methods for the fixed call sites, generated
+# with the expected token and the messages folded in as constants
+_EXPECT_TEMPLATE = """
+def _expect_{name}(self):
+    tok = self.lexer.next()
+    if tok != {expected!r}:
+        raise ParserError({error!r} + str(tok))
+    if self.debug:
+        self.log({matched!r})
+"""
+
+for _expected, _name in (('(', 'lparen'), (')', 'rparen'), (';', 'semi')):
+    _namespace = {'ParserError': ParserError}
+    exec(_EXPECT_TEMPLATE.format(
+        name=_name,
+        expected=_expected,
+        error=f"Expected {_expected}, got ",
+        matched=f"Matched expected token: {_expected}",
+    ), _namespace)
+    setattr(PredictiveParser, f'_expect_{_name}', _namespace[f'_expect_{_name}'])
 
 def test_parser(tokens, description):
     print("\n" + "="*60)
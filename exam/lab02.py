@@ -17,6 +17,8 @@ class Tag:
     NE = 263  # !=
 
 class Token:
+    __slots__ = ('tag',)
+    
     def __init__(self, tag):
         self.tag = tag
     
@@ -27,21 +29,47 @@ class Token:
         return self.__str__()
 
 class Num(Token):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
-        super().__init__(Tag.NUM)
+        self.tag = Tag.NUM
         self.value = value
     
     def __str__(self):
         return f"Num<{self.value}>"
 
 class Word(Token):
+    __slots__ = ('lexeme',)
+    
     def __init__(self, tag, lexeme):
-        super().__init__(tag)
+        self.tag = tag
         self.lexeme = lexeme
     
     def __str__(self):
         return f"Word<{self.tag}, '{self.lexeme}'>"
 
+# Character classes for Lexer.scan, tested with a bitwise AND
+_DIGIT = 1
+_ALPHA = 2
+_ALNUM = 4
+
+def _classify(c):
+    return ((_DIGIT if c.isdigit() else 0) |
+            (_ALPHA if c.isalpha() else 0) |
+            (_ALNUM if c.isalnum() else 0))
+
+# Precomputed classes for the first 256 code points; others use _classify
+_CLASS = bytes(_classify(chr(i)) for i in range(256))
+
+def as_token(tok):
+    """Convert a (tag, value) tuple returned by Lexer.scan into a Token/Num/Word"""
+    tag, value = tok
+    if value is None:
+        return Token(tag)
+    if tag == Tag.NUM:
+        return Num(value)
+    return Word(tag, value)
+
 class Lexer:
     def __init__(self, input_text=None):
         self.line = 1
@@ -55,7 +83,7 @@ class Lexer:
         self.reserve(Word(Tag.FALSE, "false"))
     
     def reserve(self, word):
-        self.words[word.lexeme] = word
+        self.words[word.lexeme] = (word.tag, word.lexeme)
     
     def read_char(self):
         if self.input_text:
@@ -67,47 +95,105 @@ class Lexer:
         else:
             return sys.stdin.read(1)
     
-    def scan(self):
-        # Skip whitespace
+    def read_run(self, flag):
+        """Consume the run of characters of class flag starting at peek"""
+        text = self.input_text
+        if not text:
+            # stdin fallback: one character at a time
+            buffer = []
+            while _classify(self.peek) & flag:
+                buffer.append(self.peek)
+                self.peek = self.read_char()
+            return ''.join(buffer)
+        
+        # In-memory input: peek is text[i - 1], so slice the run out directly
+        cls = _CLASS
+        n = len(text)
+        i = self.input_index
+        start = i - 1
+        while i < n:
+            c = text[i]
+            o = ord(c)
+            if not (cls[o] if o < 256 else _classify(c)) & flag:
+                break
+            i += 1
+        lexeme = text[start:i]
+        
+        if i < n:
+            self.peek = text[i]
+            i += 1
+        else:
+            self.peek = '\0'
+        self.input_index = i
+        return lexeme
+    
+    def skip_whitespace(self):
+        """Skip blanks and newlines before peek; return False at end of input"""
+        text = self.input_text
+        if not text:
+            # stdin fallback: one character at a time
+            while True:
+                if self.peek in ' \t':
+                    pass
+                elif self.peek == '\n':
+                    self.line += 1
+                else:
+                    return True
+                self.peek = self.read_char()
+                if self.peek == '\0':
+                    return False
+        
+        # In-memory input: read_char inlined over locals, state stored once
+        n = len(text)
+        i = self.input_index
+        peek = self.peek
+        line = self.line
+        at_end = False
         while True:
-            if self.peek in ' \t':
+            if peek == ' ' or peek == '\t':
                 pass
-            elif self.peek == '\n':
-                self.line += 1
+            elif peek == '\n':
+                line += 1
+            else:
+                break
+            if i < n:
+                peek = text[i]
+                i += 1
             else:
+                peek = '\0'
+            if peek == '\0':
+                at_end = True
                 break
-            self.peek = self.read_char()
-            if self.peek == '\0':
-                return Token(Tag.NUM)
+        self.peek = peek
+        self.input_index = i
+        self.line = line
+        return not at_end
+    
+    def scan(self):
+        if not self.skip_whitespace():
+            return (Tag.NUM, None)
+        
+        o = ord(self.peek)
+        k = _CLASS[o] if o < 256 else _classify(self.peek)
         
         # Handle numbers
-        if self.peek.isdigit():
-            v = 0
-            while self.peek.isdigit():
-                v = v * 10 + int(self.peek)
-                self.peek = self.read_char()
-            return Num(v)
+        if k & _DIGIT:
+            return (Tag.NUM, int(self.read_run(_DIGIT)))
         
         # Handle identifiers and keywords
-        if self.peek.isalpha():
-            buffer = []
-            while self.peek.isalnum():
-                buffer.append(self.peek)
-                self.peek = self.read_char()
-            s = ''.join(buffer)
+        if k & _ALPHA:
+            s = self.read_run(_ALNUM)
             
-            # Check if reserved word
+            # Reserved words and identifiers seen before are interned in
+            # self.words; a new identifier is created and stored once
             w = self.words.get(s)
-            if w is not None:
-                return w
-            
-            # It's an identifier
-            w = Word(Tag.ID, s)
-            self.words[s] = w
+            if w is None:
+                w = (Tag.ID, s)
+                self.words[s] = w
             return w
         
         # Handle single character tokens
-        t = Token(ord(self.peek))
+        t = (ord(self.peek), None)
         self.peek = ' '
         return t
 
@@ -117,10 +203,10 @@ class Parser:
         self.lookahead = self.lexer.scan()
     
     def match(self, expected_tag):
-        if self.lookahead.tag == expected_tag:
+        if self.lookahead[0] == expected_tag:
             self.lookahead = self.lexer.scan()
         else:
-            raise SyntaxError(f"Expected {expected_tag}, got {self.lookahead.tag}")
+            raise SyntaxError(f"Expected {expected_tag}, got {self.lookahead[0]}")
     
     def expr(self):
         # Non-recursive expr implementation
@@ -129,25 +215,41 @@ class Parser:
         self.term()
         
         # Instead of recursive rest(), handle operators in a loop
-        while self.lookahead.tag in {ord('+'), ord('-')}:
-            if self.lookahead.tag == ord('+'):
-                self.match(ord('+'))
+        while self.lookahead[0] in {ord('+'), ord('-')}:
+            if self.lookahead[0] == ord('+'):
+                self.match_plus()
                 self.term()
                 print('+', end='')
-            elif self.lookahead.tag == ord('-'):
-                self.match(ord('-'))
+            elif self.lookahead[0] == ord('-'):
+                self.match_minus()
                 self.term()
                 print('-', end='')
     
     def term(self):
         # Non-recursive term implementation
         # Original version was already non-recursive, but included here for completeness
-        if self.lookahead.tag == Tag.NUM:
-            print(self.lookahead.value, end='')
-            self.match(Tag.NUM)
+        tag, value = self.lookahead
+        if tag == Tag.NUM and value is not None:
+            print(value, end='')
+            self.match_num()
         else:
             raise SyntaxError("Expected number")
 
+# Specialized match_<name>() methods for the fixed call sites, generated
+# with the expected tag folded in as a constant
+_MATCH_TEMPLATE = """
+def match_{name}(self):
+    if self.lookahead[0] == {tag!r}:
+        self.lookahead = self.lexer.scan()
+    else:
+        raise SyntaxError({error!r} + str(self.lookahead[0]))
+"""
+
+for _tag, _name in ((ord('+'), 'plus'), (ord('-'), 'minus'), (Tag.NUM, 'num')):
+    _namespace = {}
+    exec(_MATCH_TEMPLATE.format(name=_name, tag=_tag, error=f"Expected {_tag}, got "), _namespace)
+    setattr(Parser, f'match_{_name}', _namespace[f'match_{_name}'])
+
 def main():
     print("Testing Non-recursive Parser:")
     print("=" * 50)
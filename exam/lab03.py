@@ -6,10 +6,19 @@ Supports:
 - Numbers and variables
 """
 
-class Token:
-    def __init__(self, type, value):
-        self.type = type
-        self.value = value
+import re
+
+# Tokens are (type, value) tuples; the group name is the token type.
+# NUMBER keeps the original "digit followed by digits or dots" rule and
+# VARIABLE is a letter followed by letters or digits, both ASCII only;
+# any other character is INVALID.
+_TOKEN_RE = re.compile(r"""
+    (?P<NUMBER>[0-9][0-9.]*)
+  | (?P<VARIABLE>[A-Za-z][A-Za-z0-9]*)
+  | (?P<OPERATOR>[-+*/()])
+  | (?P<SPACE>\s+)
+  | (?P<INVALID>.)
+""", re.VERBOSE | re.DOTALL)
 
 class InfixToPostfix:
     def __init__(self):
@@ -22,43 +31,15 @@ class InfixToPostfix:
         }
         
     def tokenize(self, expression):
-        """Convert input string into list of tokens"""
+        """Convert input string into list of (type, value) tokens"""
         tokens = []
-        i = 0
-        while i < len(expression):
-            char = expression[i]
-            
-            # Skip whitespace
-            if char.isspace():
-                i += 1
-                continue
-                
-            # Handle numbers (including multi-digit)
-            if char.isdigit():
-                num = ""
-                while i < len(expression) and (expression[i].isdigit() or expression[i] == '.'):
-                    num += expression[i]
-                    i += 1
-                tokens.append(Token('NUMBER', num))
-                continue
-                
-            # Handle variables/identifiers
-            if char.isalpha():
-                var = ""
-                while i < len(expression) and (expression[i].isalnum()):
-                    var += expression[i]
-                    i += 1
-                tokens.append(Token('VARIABLE', var))
+        for m in _TOKEN_RE.finditer(expression):
+            kind = m.lastgroup
+            if kind == 'SPACE':
                 continue
-                
-            # Handle operators and parentheses
-            if char in '+-*/()':
-                tokens.append(Token('OPERATOR', char))
-                i += 1
-                continue
-                
-            raise ValueError(f"Invalid character: {char}")
-            
+            if kind == 'INVALID':
+                raise ValueError(f"Invalid character: {m.group()}")
+            tokens.append((kind, m.group()))
         return tokens
 
     def translate(self, expression):
@@ -67,33 +48,41 @@ class InfixToPostfix:
         operator_stack = []
         output = []
         
-        for token in tokens:
-            if token.type in ('NUMBER', 'VARIABLE'):
-                output.append(token.value)
+        # Bind hot lookups to locals once
+        out_append = output.append
+        stk = operator_stack
+        stk_append = stk.append
+        stk_pop = stk.pop
+        prec = self.precedence
+        
+        for token_type, value in tokens:
+            if token_type != 'OPERATOR':
+                out_append(value)
                 
-            elif token.value == '(':
-                operator_stack.append(token.value)
+            elif value == '(':
+                stk_append(value)
                 
-            elif token.value == ')':
-                while operator_stack and operator_stack[-1] != '(':
-                    output.append(operator_stack.pop())
-                if operator_stack and operator_stack[-1] == '(':
-                    operator_stack.pop()  # remove '('
+            elif value == ')':
+                while stk and stk[-1] != '(':
+                    out_append(stk_pop())
+                if stk:
+                    stk_pop()  # remove '('
                 else:
                     raise ValueError("Mismatched parentheses")
                     
             else:  # operators
-                while (operator_stack and operator_stack[-1] != '(' and 
-                       self.precedence[operator_stack[-1]] >= self.precedence[token.value]):
-                    output.append(operator_stack.pop())
-                operator_stack.append(token.value)
+                # '(' has precedence 0, so it always stops the loop
+                tok_prec = prec[value]
+                while stk and prec[stk[-1]] >= tok_prec:
+                    out_append(stk_pop())
+                stk_append(value)
         
         # Pop remaining operators
         while operator_stack:
             op = operator_stack.pop()
             if op == '(':
                 raise ValueError("Mismatched parentheses")
-            output.append(op)
+            out_append(op)
             
         return ' '.join(output)
 
@@ -7,6 +7,14 @@ Handles:
 - Comments (both single-line and multi-line)
 """
 
+import re
+
+# Comments and whitespace runs, removed in a single pass by the regex engine.
+# Block comments use the unrolled form, which consumes runs of non-'*'
+# characters in one step instead of testing for '*/' at every character.
+# An unterminated block comment runs to the end of the source.
+_CLEAN = re.compile(r'//[^\n]*|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|/\*[\s\S]*|\s+')
+
 class WhitespaceSkipper:
     def __init__(self, source):
         self.source = source
@@ -16,47 +24,37 @@ class WhitespaceSkipper:
     
     def skip_whitespace(self):
         """Skip all whitespace and comments, return the cleaned content"""
+        source = self.source
         result = []
-        while self.pos < len(self.source):
-            char = self.source[self.pos]
-            
-            # Handle standard whitespace (space, tab, newline)
-            if char.isspace():
-                if char == '\n':
-                    self.line += 1
-                    self.column = 1
-                elif char == '\t':
-                    self.column += 4  # assuming tab = 4 spaces
-                else:
-                    self.column += 1
-                self.pos += 1
-                continue
-            
-            # Handle single-line comments
-            if char == '/' and self.pos + 1 < len(self.source) and self.source[self.pos + 1] == '/':
-                self.pos += 2  # skip '//'
-                while self.pos < len(self.source) and self.source[self.pos] != '\n':
-                    self.pos += 1
-                continue
-            
-            # Handle multi-line comments
-            if char == '/' and self.pos + 1 < len(self.source) and self.source[self.pos + 1] == '*':
-                self.pos += 2  # skip '/*'
-                while self.pos + 1 < len(self.source):
-                    if self.source[self.pos] == '*' and self.source[self.pos + 1] == '/':
-                        self.pos += 2  # skip '*/'
-                        break
-                    if self.source[self.pos] == '\n':
-                        self.line += 1
-                        self.column = 1
-                    self.pos += 1
-                continue
-            
-            # Non-whitespace character found
-            result.append(char)
-            self.column += 1
-            self.pos += 1
+        line = self.line
+        column = self.column
+        last = self.pos
+        
+        # The position is updated once per match: kept text and whitespace
+        # advance the column (tab = 4 columns), while a comment only counts
+        # the newlines inside it
+        for m in _CLEAN.finditer(source, self.pos):
+            start, end = m.span()
+            if start > last:
+                result.append(source[last:start])
+                column += start - last
+            text = m.group()
+            newlines = text.count('\n')
+            if newlines:
+                line += newlines
+                column = 1
+            if text[0] != '/':
+                tail = text[text.rfind('\n') + 1:]
+                column += len(tail) + 3 * tail.count('\t')
+            last = end
+        
+        if last < len(source):
+            result.append(source[last:])
+            column += len(source) - last
         
+        self.pos = len(source)
+        self.line = line
+        self.column = column
         return ''.join(result)
     
     def get_position_info(self):
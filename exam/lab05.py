@@ -6,7 +6,23 @@ Implements a lexical analyzer that can:
 3. Build a symbol table
 """
 
+import re
+import string
+
+# One pass over the input in the regex engine: identifiers start with a
+# letter or '_', numbers with a digit, and any other non-space character
+# is a single-character symbol. Whitespace falls between matches.
+# LexicalAnalyzer puts a KEYWORD alternative in front of these.
+_TOKEN_PATTERN = r'(?P<IDENTIFIER>[^\W\d]\w*)|(?P<NUMBER>\d[\d.]*)|(?P<SYMBOL>\S)'
+_WHITESPACE_RE = re.compile(r'\s*')
+
+# ASCII identifier characters, checked before the Unicode-aware str methods
+_IDENT_START = frozenset(string.ascii_letters + '_')
+_IDENT_CHARS = _IDENT_START | frozenset(string.digits)
+
 class Token:
+    __slots__ = ('type', 'value', 'line', 'column')
+    
     def __init__(self, type, value, line, column):
         self.type = type
         self.value = value
@@ -19,11 +35,16 @@ class Token:
 class LexicalAnalyzer:
     def __init__(self):
         # Define keywords (using C-like language keywords as example)
-        self.keywords = {
+        self.keywords = frozenset({
             'if', 'else', 'while', 'for', 'do', 'break', 'continue',
             'int', 'float', 'char', 'void', 'return', 'struct',
             'switch', 'case', 'default', 'const', 'static'
-        }
+        })
+        
+        # Keywords are recognized by the scanner itself: a keyword literal
+        # counts only when it is not followed by more identifier characters
+        keyword_alt = '|'.join(re.escape(kw) for kw in sorted(self.keywords))
+        self._token_re = re.compile(rf'(?P<KEYWORD>(?:{keyword_alt})(?!\w))|{_TOKEN_PATTERN}')
         
         # Symbol table for identifiers
         self.symbol_table = {}
@@ -35,72 +56,70 @@ class LexicalAnalyzer:
         
     def is_valid_identifier_start(self, char):
         """Check if character can start an identifier"""
-        return char.isalpha() or char == '_'
+        return char in _IDENT_START or char.isalpha()
     
     def is_valid_identifier_char(self, char):
         """Check if character can be in an identifier"""
-        return char.isalnum() or char == '_'
+        return char in _IDENT_CHARS or char.isalnum()
     
     def skip_whitespace(self, text):
         """Skip whitespace and update position"""
-        while self.pos < len(text) and text[self.pos].isspace():
-            if text[self.pos] == '\n':
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
-            self.pos += 1
+        start = self.pos
+        end = _WHITESPACE_RE.match(text, start).end()
+        newlines = text.count('\n', start, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - text.rfind('\n', start, end)
+        else:
+            self.column += end - start
+        self.pos = end
     
     def analyze(self, text):
         """Analyze input text and return list of tokens"""
         tokens = []
-        self.pos = 0
-        self.line = 1
-        self.column = 1
         
-        while self.pos < len(text):
-            self.skip_whitespace(text)
-            if self.pos >= len(text):
-                break
-            
-            char = text[self.pos]
-            start_column = self.column
-            
-            # Handle identifiers and keywords
-            if self.is_valid_identifier_start(char):
-                start = self.pos
-                while self.pos < len(text) and self.is_valid_identifier_char(text[self.pos]):
-                    self.pos += 1
-                    self.column += 1
-                
-                word = text[start:self.pos]
-                
-                if word in self.keywords:
-                    tokens.append(Token('KEYWORD', word, self.line, start_column))
-                else:
-                    # Add to symbol table if it's an identifier
-                    if word not in self.symbol_table:
-                        self.symbol_table[word] = {
-                            'first_seen': (self.line, start_column),
-                            'occurrences': []
-                        }
-                    self.symbol_table[word]['occurrences'].append((self.line, start_column))
-                    tokens.append(Token('IDENTIFIER', word, self.line, start_column))
+        # Bind loop invariants and bound methods to locals once
+        append = tokens.append
+        count = text.count
+        rfind = text.rfind
+        symbol_table = self.symbol_table
+        get_entry = symbol_table.get
+        line = 1
+        line_start = 0  # offset of the first character of the current line
+        last = 0
+        
+        # Lexemes never contain a newline, so positions only need the
+        # newlines skipped between the previous match and this one
+        for m in self._token_re.finditer(text):
+            start = m.start()
+            newlines = count('\n', last, start)
+            if newlines:
+                line += newlines
+                line_start = rfind('\n', last, start) + 1
+            last = start
+            start_column = start - line_start + 1
+            kind = m.lastgroup
+            word = m.group()
             
-            # Handle numbers
-            elif char.isdigit():
-                start = self.pos
-                while self.pos < len(text) and (text[self.pos].isdigit() or text[self.pos] == '.'):
-                    self.pos += 1
-                    self.column += 1
-                tokens.append(Token('NUMBER', text[start:self.pos], self.line, start_column))
+            # Add identifiers to the symbol table, with one lookup per
+            # occurrence once the name is known
+            if kind == 'IDENTIFIER':
+                entry = get_entry(word)
+                if entry is None:
+                    entry = symbol_table[word] = {
+                        'first_seen': (line, start_column),
+                        'occurrences': []
+                    }
+                entry['occurrences'].append((line, start_column))
+                append(Token('IDENTIFIER', word, line, start_column))
             
-            # Handle operators and other characters
+            # Handle keywords, numbers, operators and other characters
             else:
-                tokens.append(Token('SYMBOL', char, self.line, self.column))
-                self.pos += 1
-                self.column += 1
+                append(Token(kind, word, line, start_column))
         
+        self.pos = len(text)
+        self.line = text.count('\n') + 1
+        self.column = len(text) - text.rfind('\n')
         return tokens
 
 def main():
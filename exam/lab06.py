@@ -9,6 +9,7 @@ Features:
 6. Provides detailed error reporting
 """
 
+from bisect import bisect_right
 from enum import Enum, auto
 import re
 
@@ -56,15 +57,71 @@ class TokenType(Enum):
     EOF = auto()
     ERROR = auto()
 
+# Start of Token.__str__ for each token type, formatted once
+_PREFIX = {t: f"Token({t}, '" for t in TokenType}
+
 class Token:
-    def __init__(self, type, value, line, column):
+    # Only the source offset is stored; line and column are looked up in the
+    # scanner's line starts when they are read
+    __slots__ = ('type', 'value', 'offset', '_line_starts')
+    
+    def __init__(self, type, value, offset, line_starts):
         self.type = type
         self.value = value
-        self.line = line
-        self.column = column
+        self.offset = offset
+        self._line_starts = line_starts
+    
+    @property
+    def line(self):
+        return bisect_right(self._line_starts, self.offset)
+    
+    @property
+    def column(self):
+        line_starts = self._line_starts
+        return self.offset - line_starts[bisect_right(line_starts, self.offset) - 1] + 2
     
     def __str__(self):
-        return f"Token({self.type}, '{self.value}') at line {self.line}, column {self.column}"
+        # One bisect serves both the line and the column
+        line_starts = self._line_starts
+        line = bisect_right(line_starts, self.offset)
+        column = self.offset - line_starts[line - 1] + 2
+        return f"{_PREFIX[self.type]}{self.value}') at line {line}, column {column}"
+
+class SymbolInfo:
+    # Source offsets of an identifier's first and every occurrence. The symbol
+    # table outlives a single source, so each run of occurrences from one
+    # source is recorded as (index of its first occurrence, line starts of
+    # that source); every offset can then be placed in the source it came from.
+    __slots__ = ('first_seen', 'occurrences', '_sources')
+    
+    def __init__(self, first_seen, line_starts):
+        self.first_seen = first_seen
+        self.occurrences = []
+        self._sources = [(0, line_starts)]
+    
+    def add(self, offset, line_starts):
+        """Record an occurrence at offset in the source with line_starts"""
+        if line_starts is not self._sources[-1][1]:
+            self._sources.append((len(self.occurrences), line_starts))
+        self.occurrences.append(offset)
+    
+    @property
+    def first_position(self):
+        """(line, column) where the identifier was first seen"""
+        line_starts = self._sources[0][1]
+        line = bisect_right(line_starts, self.first_seen)
+        return line, self.first_seen - line_starts[line - 1] + 2
+    
+    def positions(self):
+        """(line, column) of every occurrence, each in its own source"""
+        result = []
+        sources = self._sources
+        for k, (begin, line_starts) in enumerate(sources):
+            stop = sources[k + 1][0] if k + 1 < len(sources) else len(self.occurrences)
+            for offset in self.occurrences[begin:stop]:
+                line = bisect_right(line_starts, offset)
+                result.append((line, offset - line_starts[line - 1] + 2))
+        return result
 
 class LexicalError(Exception):
     def __init__(self, message, line, column):
@@ -73,6 +130,30 @@ class LexicalError(Exception):
         self.column = column
         super().__init__(f"{message} at line {line}, column {column}")
 
+# Master pattern used by get_next_token and tokenize: each match skips any
+# whitespace and comments, then takes one lexeme, so the regex engine walks
+# the characters and Python only sees tokens. Alternatives are tried in
+# order; '/' only matches as an operator when it does not open a comment.
+# Unterminated strings and bad character literals fall through to ERROR,
+# where the exact error is worked out, and END matches once only skipped
+# input remains.
+_MASTER_RE = re.compile(r"""
+    (?:\s+|//[^\n]*|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|/\*.*)*
+    (?:
+    (?P<IDENT>[^\W\d]\w*)
+  | (?P<NUMBER>\d[\d.]*)
+  | (?P<STRING>"[^"\\]*(?:\\.[^"\\]*)*")
+  | (?P<CHAR>'(?:\\[nt'\\]|[^\\])')
+  | (?P<OP>==|!=|<=|>=|[-+*/=<>(){};,])
+  | (?P<ERROR>.)
+  | (?P<END>\Z)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+# Characters allowed after a backslash in string and character literals
+_STR_ESCAPES = frozenset('nt"\\')
+_CHAR_ESCAPES = frozenset("nt'\\")
+
 class LexicalAnalyzer:
     def __init__(self):
         # Keywords mapping
@@ -115,18 +196,59 @@ class LexicalAnalyzer:
         # State variables
         self.source = ""
         self.pos = 0
-        self.line = 1
-        self.column = 1
         self.current_char = None
+        self._line_starts = [0]  # offset of the first character of each line
+        
+        # Token builder for each lexeme group of _MASTER_RE; END has none
+        self._handlers = {
+            'IDENT': self._emit_ident,
+            'NUMBER': self._emit_number,
+            'STRING': self._emit_string,
+            'CHAR': self._emit_char,
+            'OP': self._emit_op,
+            'ERROR': self._emit_error,
+            'END': None,
+        }
     
     def init_scanner(self, source):
         """Initialize the scanner with source code"""
         self.source = source
         self.pos = 0
-        self.line = 1
-        self.column = 1
+        
+        # Line starts are found once here; positions are looked up from
+        # them only when a token or error needs one
+        line_starts = [0]
+        i = source.find('\n')
+        while i != -1:
+            line_starts.append(i + 1)
+            i = source.find('\n', i + 1)
+        self._line_starts = line_starts
+        
         self.advance()
     
+    def line_col(self, offset):
+        """(line, column) of a source offset. Columns count from 2 at the
+        start of a line, as the scanner has always reported them."""
+        line_starts = self._line_starts
+        line = bisect_right(line_starts, offset)
+        return line, offset - line_starts[line - 1] + 2
+    
+    def _here(self):
+        """(line, column) of the current character"""
+        if self.current_char:
+            return self.line_col(self.pos - 1)
+        # At end of input the column is not advanced past the last character
+        line, column = self.line_col(self.pos)
+        return line, column - 1
+    
+    @property
+    def line(self):
+        return self._here()[0]
+    
+    @property
+    def column(self):
+        return self._here()[1]
+    
     def advance(self):
         """Move to next character"""
         if self.pos >= len(self.source):
@@ -134,7 +256,6 @@ class LexicalAnalyzer:
         else:
             self.current_char = self.source[self.pos]
             self.pos += 1
-            self.column += 1
     
     def peek(self):
         """Look at next character without consuming it"""
@@ -143,171 +264,26 @@ class LexicalAnalyzer:
             return None
         return self.source[peek_pos]
     
-    def skip_whitespace(self):
-        """Skip whitespace characters"""
-        while self.current_char and self.current_char.isspace():
-            if self.current_char == '\n':
-                self.line += 1
-                self.column = 1
-            self.advance()
-    
-    def skip_comment(self):
-        """Skip single and multi-line comments"""
-        if self.current_char == '/' and self.peek() == '/':
-            # Single-line comment
-            while self.current_char and self.current_char != '\n':
-                self.advance()
-        elif self.current_char == '/' and self.peek() == '*':
-            # Multi-line comment
-            self.advance()  # skip /
-            self.advance()  # skip *
-            while self.current_char:
-                if self.current_char == '*' and self.peek() == '/':
-                    self.advance()  # skip *
-                    self.advance()  # skip /
-                    break
-                if self.current_char == '\n':
-                    self.line += 1
-                    self.column = 1
-                self.advance()
-    
-    def read_identifier(self):
-        """Read an identifier or keyword"""
-        start_column = self.column
-        result = ""
-        
-        while self.current_char and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        
-        # Check if it's a keyword
-        token_type = self.keywords.get(result, TokenType.IDENTIFIER)
-        token = Token(token_type, result, self.line, start_column)
-        
-        # Add to symbol table if it's an identifier
-        if token_type == TokenType.IDENTIFIER:
-            if result not in self.symbol_table:
-                self.symbol_table[result] = {
-                    'first_seen': (self.line, start_column),
-                    'occurrences': []
-                }
-            self.symbol_table[result]['occurrences'].append((self.line, start_column))
-        
-        return token
-    
-    def read_number(self):
-        """Read a number (integer or float)"""
-        start_column = self.column
-        result = ""
-        is_float = False
-        
-        while self.current_char and (self.current_char.isdigit() or self.current_char == '.'):
-            if self.current_char == '.':
-                if is_float:
-                    raise LexicalError("Invalid float literal", self.line, self.column)
-                is_float = True
-            result += self.current_char
-            self.advance()
-        
-        if is_float:
-            return Token(TokenType.FLOAT_LITERAL, float(result), self.line, start_column)
-        return Token(TokenType.INTEGER, int(result), self.line, start_column)
-    
-    def read_string(self):
-        """Read a string literal"""
-        start_column = self.column
-        self.advance()  # skip opening quote
-        result = ""
-        
-        while self.current_char and self.current_char != '"':
-            if self.current_char == '\\':
-                self.advance()
-                if self.current_char in {'n', 't', '"', '\\'}:
-                    result += '\\' + self.current_char
-                else:
-                    raise LexicalError("Invalid escape sequence", self.line, self.column)
-            else:
-                result += self.current_char
-            self.advance()
-        
-        if not self.current_char:
-            raise LexicalError("Unterminated string literal", self.line, start_column)
-        
-        self.advance()  # skip closing quote
-        return Token(TokenType.STRING, result, self.line, start_column)
-    
-    def read_char_literal(self):
-        """Read a character literal"""
-        start_column = self.column
-        self.advance()  # skip opening quote
-        
-        if not self.current_char:
-            raise LexicalError("Unterminated character literal", self.line, start_column)
-        
-        if self.current_char == '\\':
-            self.advance()
-            if self.current_char in {'n', 't', "'", '\\'}:
-                value = '\\' + self.current_char
-            else:
-                raise LexicalError("Invalid escape sequence", self.line, self.column)
-        else:
-            value = self.current_char
-        
-        self.advance()
-        
-        if self.current_char != "'":
-            raise LexicalError("Unterminated character literal", self.line, start_column)
-        
-        self.advance()  # skip closing quote
-        return Token(TokenType.CHAR_LITERAL, value, self.line, start_column)
-    
     def get_next_token(self):
         """Get the next token from input"""
-        while self.current_char:
-            # Skip whitespace and comments
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-            
-            if self.current_char == '/' and (self.peek() == '/' or self.peek() == '*'):
-                self.skip_comment()
-                continue
-            
-            # Identifier or keyword
-            if self.current_char.isalpha() or self.current_char == '_':
-                return self.read_identifier()
-            
-            # Number
-            if self.current_char.isdigit():
-                return self.read_number()
-            
-            # String literal
-            if self.current_char == '"':
-                return self.read_string()
-            
-            # Character literal
-            if self.current_char == "'":
-                return self.read_char_literal()
-            
-            # Multi-character operators
-            if self.current_char in {'=', '!', '<', '>'}:
-                op = self.current_char
-                if self.peek() == '=':
-                    op += '='
-                    self.advance()
-                    self.advance()
-                    return Token(self.operators[op], op, self.line, self.column - len(op))
-            
-            # Single-character operators and delimiters
-            if self.current_char in self.operators:
-                char = self.current_char
-                self.advance()
-                return Token(self.operators[char], char, self.line, self.column - 1)
-            
-            # Invalid character
-            raise LexicalError(f"Invalid character: {self.current_char}", self.line, self.column)
+        source = self.source
+        m = _MASTER_RE.match(source, self.pos - 1 if self.current_char else self.pos)
+        kind = m.lastgroup
+        handler = self._handlers[kind]
+        if handler is None:
+            self.pos = len(source)
+            self.current_char = None
+            return Token(TokenType.EOF, None, self.pos, self._line_starts)
         
-        return Token(TokenType.EOF, None, self.line, self.column)
+        # Stand on the lexeme while it is built, so a lexical error leaves
+        # the scanner at the start of the offending lexeme
+        start, end = m.span(kind)
+        self.pos = start
+        self.advance()
+        token = handler(source, start, end)
+        self.pos = end
+        self.advance()
+        return token
     
     def tokenize(self, source):
         """Tokenize the entire source code"""
@@ -315,16 +291,90 @@ class LexicalAnalyzer:
         tokens = []
         
         try:
-            while True:
-                token = self.get_next_token()
-                tokens.append(token)
-                if token.type == TokenType.EOF:
-                    break
+            tokens = self._scan_all(source)
         except LexicalError as e:
             print(f"Lexical Error: {e}")
             return []
         
         return tokens
+    
+    # Scanning with _MASTER_RE, shared by get_next_token and tokenize. Tokens
+    # and the symbol table record offsets, so no line tracking is needed.
+    
+    def _scan_all(self, source):
+        """Scan all of source with the master pattern, ending with EOF"""
+        handlers = self._handlers
+        tokens = []
+        append = tokens.append
+        
+        for m in _MASTER_RE.finditer(source):
+            kind = m.lastgroup
+            handler = handlers[kind]
+            if handler is None:
+                break
+            start, end = m.span(kind)
+            append(handler(source, start, end))
+        
+        self.pos = len(source)
+        self.current_char = None
+        append(Token(TokenType.EOF, None, self.pos, self._line_starts))
+        return tokens
+    
+    def _emit_ident(self, source, start, end):
+        result = source[start:end]
+        token_type = self.keywords.get(result, TokenType.IDENTIFIER)
+        if token_type == TokenType.IDENTIFIER:
+            info = self.symbol_table.get(result)
+            if info is None:
+                info = self.symbol_table[result] = SymbolInfo(start, self._line_starts)
+            info.add(start, self._line_starts)
+        return Token(token_type, result, start, self._line_starts)
+    
+    def _emit_number(self, source, start, end):
+        result = source[start:end]
+        dot = result.find('.')
+        if dot == -1:
+            return Token(TokenType.INTEGER, int(result), start, self._line_starts)
+        second = result.find('.', dot + 1)
+        if second != -1:
+            raise LexicalError("Invalid float literal", *self.line_col(start + second))
+        return Token(TokenType.FLOAT_LITERAL, float(result), start, self._line_starts)
+    
+    def _check_escapes(self, source, start, stop, allowed):
+        """Raise for the first backslash in source[start:stop] not followed by
+        a character in allowed"""
+        i = source.find('\\', start, stop)
+        while i != -1:
+            if i + 1 >= len(source):
+                # Nothing follows the backslash, so it is reported itself
+                raise LexicalError("Invalid escape sequence", *self.line_col(i))
+            if source[i + 1] not in allowed:
+                raise LexicalError("Invalid escape sequence", *self.line_col(i + 1))
+            i = source.find('\\', i + 2, stop)
+    
+    def _emit_string(self, source, start, end):
+        self._check_escapes(source, start + 1, end - 1, _STR_ESCAPES)
+        # Escapes are kept as written, so the value is the text between the quotes
+        return Token(TokenType.STRING, source[start + 1:end - 1], start, self._line_starts)
+    
+    def _emit_char(self, source, start, end):
+        return Token(TokenType.CHAR_LITERAL, source[start + 1:end - 1], start, self._line_starts)
+    
+    def _emit_op(self, source, start, end):
+        op = source[start:end]
+        return Token(self.operators[op], op, start, self._line_starts)
+    
+    def _emit_error(self, source, start, end):
+        char = source[start]
+        if char == '"':
+            # A bad escape is reported before a missing closing quote
+            self._check_escapes(source, start + 1, len(source), _STR_ESCAPES)
+            raise LexicalError("Unterminated string literal", *self.line_col(start))
+        if char == "'":
+            if source.startswith('\\', start + 1):
+                self._check_escapes(source, start + 1, start + 2, _CHAR_ESCAPES)
+            raise LexicalError("Unterminated character literal", *self.line_col(start))
+        raise LexicalError(f"Invalid character: {char}", *self.line_col(start))
 
 def main():
     print("Complete Lexical Analyzer")
@@ -379,9 +429,10 @@ def main():
         
         print("\nSymbol table:")
         for identifier, info in analyzer.symbol_table.items():
+            line, column = info.first_position
             print(f"Identifier: {identifier}")
-            print(f"  First seen at: Line {info['first_seen'][0]}, Column {info['first_seen'][1]}")
-            print(f"  Occurrences: {len(info['occurrences'])}")
+            print(f"  First seen at: Line {line}, Column {column}")
+            print(f"  Occurrences: {len(info.occurrences)}")
     
     # Interactive mode
     print("\nInteractive Mode")
@@ -409,9 +460,10 @@ def main():
             
             print("\nSymbol table:")
             for identifier, info in analyzer.symbol_table.items():
+                line, column = info.first_position
                 print(f"Identifier: {identifier}")
-                print(f"  First seen at: Line {info['first_seen'][0]}, Column {info['first_seen'][1]}")
-                print(f"  Occurrences: {len(info['occurrences'])}")
+                print(f"  First seen at: Line {line}, Column {column}")
+                print(f"  Occurrences: {len(info.occurrences)}")
 
 if __name__ == "__main__":
     main()
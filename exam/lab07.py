@@ -8,8 +8,9 @@ Features:
 5. Maintains scope hierarchy
 """
 
+from collections import ChainMap
 from enum import Enum, auto
-from typing import Dict, Optional, List
+from typing import Dict, Mapping, Optional, List
 
 class SymbolType(Enum):
     VARIABLE = auto()
@@ -19,6 +20,8 @@ class SymbolType(Enum):
     CONSTANT = auto()
 
 class Symbol:
+    __slots__ = ('name', 'symbol_type', 'data_type', 'line_declared', 'scope_level')
+    
     def __init__(self, name: str, symbol_type: SymbolType, data_type: str = None):
         self.name = name
         self.symbol_type = symbol_type
@@ -30,8 +33,15 @@ class Symbol:
         return f"{self.name} ({self.symbol_type.name}, {self.data_type}) at line {self.line_declared}"
 
 class Scope:
+    # Fixed attribute layout. Most scopes define a single name, so it is kept
+    # inline as _names = (name,) with its symbol in _symbol; a second
+    # definition, or a read of symbols, turns _names into the symbols dict.
+    # Either way "name in self._names" tells whether the scope defines name.
+    __slots__ = ('parent', 'children', 'scope_name', 'level', '_names', '_symbol')
+    
     def __init__(self, parent: Optional['Scope'] = None, scope_name: str = ""):
-        self.symbols: Dict[str, Symbol] = {}
+        self._names = ()
+        self._symbol: Optional[Symbol] = None
         self.parent = parent
         self.children: List[Scope] = []
         self.scope_name = scope_name
@@ -40,32 +50,72 @@ class Scope:
         if parent:
             parent.children.append(self)
     
+    @property
+    def symbols(self) -> Dict[str, Symbol]:
+        """Symbols defined in this scope, as a live dict"""
+        names = self._names
+        if isinstance(names, tuple):
+            names = self._names = {name: self._symbol for name in names}
+            self._symbol = None
+        return names
+    
+    @symbols.setter
+    def symbols(self, symbols: Dict[str, Symbol]):
+        self._names = symbols
+        self._symbol = None
+    
     def define(self, symbol: Symbol) -> bool:
         """
         Define a new symbol in current scope.
         Returns False if symbol already exists in this scope.
         """
-        if symbol.name in self.symbols:
+        name = symbol.name
+        names = self._names
+        if name in names:
             return False
         
         symbol.scope_level = self.level
-        self.symbols[symbol.name] = symbol
+        if isinstance(names, tuple) and not names:
+            self._names = (name,)
+            self._symbol = symbol
+        else:
+            self.symbols[name] = symbol
         return True
     
+    def lookup_local(self, name: str) -> Optional[Symbol]:
+        """Look up a symbol defined in this scope only"""
+        names = self._names
+        if name not in names:
+            return None
+        if isinstance(names, tuple):
+            return self._symbol
+        return names[name]
+    
     def resolve(self, name: str) -> Optional[Symbol]:
         """
         Look up a symbol in this scope and all parent scopes.
         Implements the "most closely nested" rule.
         """
+        # A level that does not define name costs one membership test
         current = self
-        while current:
-            if name in current.symbols:
-                return current.symbols[name]
+        while current is not None:
+            if name in current._names:
+                return current.lookup_local(name)
             current = current.parent
         return None
     
-    def get_symbols(self) -> Dict[str, Symbol]:
-        """Get all symbols accessible from this scope"""
+    def get_symbols(self) -> Mapping[str, Symbol]:
+        """Get all symbols accessible from this scope, as a view over the
+        scopes' own dicts that stays current as symbols are defined"""
+        maps = []
+        current = self
+        while current:
+            maps.append(current.symbols)
+            current = current.parent
+        return ChainMap(*maps)
+    
+    def materialize(self) -> Dict[str, Symbol]:
+        """Get a copy of all symbols accessible from this scope"""
         result = {}
         current = self
         while current:
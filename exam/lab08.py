@@ -9,7 +9,7 @@ Handles:
 """
 
 from enum import Enum, auto
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 class NodeType(Enum):
     ID = auto()
@@ -18,6 +18,8 @@ class NodeType(Enum):
     OPERATOR = auto()
 
 class Node:
+    __slots__ = ('type', 'value', 'code')
+    
     temp_counter = 0
     
     @classmethod
@@ -29,27 +31,61 @@ class Node:
     def __init__(self, node_type: NodeType, value: str):
         self.type = node_type
         self.value = value
-        self.code: List[str] = []  # Generated instructions
+        # Generated instructions as a rope: a tuple of instruction strings and
+        # nested ropes, so combining code never copies what is already built
+        self.code: Tuple = ()
     
     def __str__(self):
         return f"{self.value}"
 
 class Expression:
+    __slots__ = ('code', 'result')
+    
     def __init__(self):
-        self.code: List[str] = []
+        self.code: List = []  # instruction strings and ropes, in order
         self.result: Optional[Node] = None
     
     def add_instruction(self, instruction: str):
         """Add a new instruction to the code sequence"""
         self.code.append(instruction)
     
-    def merge_code(self, other_code: List[str]):
+    def merge_code(self, other_code: Tuple):
         """Merge another code sequence into this one"""
-        self.code.extend(other_code)
+        self.code.append(other_code)
+    
+    def flatten(self) -> List[str]:
+        """The instruction sequence, with nested ropes expanded in order.
+        A rope shared by a reused subexpression is only expanded the first
+        time, since its temporary already holds the value."""
+        instructions = []
+        append = instructions.append
+        seen = set()
+        stack = [iter(self.code)]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, str):
+                    append(item)
+                elif id(item) not in seen:
+                    seen.add(id(item))
+                    stack.append(iter(item))
+                    break
+            else:
+                stack.pop()
+        return instructions
 
 class InstructionGenerator:
+    # Entries kept in the subexpression cache before it is cleared
+    CSE_LIMIT = 1024
+    
     def __init__(self):
         self.symbol_table = {}  # Simple symbol table for this example
+        # Result node of each (left, op, right) already generated, so a
+        # repeated subexpression reuses its temporary
+        self._cse: Dict[Tuple, Node] = {}
+        # Identifiers each cached result reads, and the cached keys that read
+        # each identifier, so an assignment can evict what it invalidates
+        self._cse_reads: Dict[Node, FrozenSet[str]] = {}
+        self._cse_readers: Dict[str, Set[Tuple]] = {}
     
     def is_identifier(self, name: str) -> bool:
         """Check if a name is a valid identifier"""
@@ -75,7 +111,7 @@ class InstructionGenerator:
         # Generate new temporary for complex expressions
         temp_name = Node.get_temp()
         temp_node = Node(NodeType.TEMP, temp_name)
-        temp_node.code = x.code + [f"{temp_name} = {x.value}"]
+        temp_node.code = (x.code, f"{temp_name} = {x.value}")
         return temp_node
     
     def lvalue(self, x: Node) -> Node:
@@ -88,15 +124,62 @@ class InstructionGenerator:
             raise ValueError(f"Cannot use {x.value} as an lvalue")
         return x
     
+    @staticmethod
+    def _cse_operand(x: Node):
+        """Cache key part for an operand: identifiers and constants by
+        value, anything else by the node itself"""
+        if x.type in {NodeType.ID, NodeType.CONSTANT}:
+            return (x.type, x.value)
+        return x
+    
+    def _reads(self, x: Node) -> Optional[FrozenSet[str]]:
+        """Identifiers whose values x depends on, or None if unknown"""
+        if x.type == NodeType.ID:
+            return frozenset((x.value,))
+        if x.type == NodeType.CONSTANT:
+            return frozenset()
+        return self._cse_reads.get(x)
+    
+    def _cse_evict(self, name: str):
+        """Drop every cached subexpression that reads name, including those
+        built on another cached result that reads it"""
+        for key in self._cse_readers.pop(name, ()):
+            node = self._cse.pop(key)
+            for other in self._cse_reads.pop(node):
+                if other != name:
+                    self._cse_readers[other].discard(key)
+    
     def gen_binary_op(self, left: Node, op: str, right: Node) -> Node:
         """Generate code for binary operation"""
+        # Looked up on the operands themselves, before rvalue() gives a
+        # computed operand a fresh temporary, so nested repeats hit too
+        key = (self._cse_operand(left), op, self._cse_operand(right))
+        result = self._cse.get(key)
+        if result is not None:
+            return result
+        
         left_rvalue = self.rvalue(left)
         right_rvalue = self.rvalue(right)
         
         temp_name = Node.get_temp()
         result = Node(NodeType.TEMP, temp_name)
-        result.code = (left_rvalue.code + right_rvalue.code +
-                      [f"{temp_name} = {left_rvalue.value} {op} {right_rvalue.value}"])
+        result.code = (left_rvalue.code, right_rvalue.code,
+                       f"{temp_name} = {left_rvalue.value} {op} {right_rvalue.value}")
+        
+        # Only cached when everything it reads is known, so an assignment
+        # can tell whether it is still valid
+        left_reads = self._reads(left)
+        right_reads = self._reads(right)
+        if left_reads is not None and right_reads is not None:
+            if len(self._cse) >= self.CSE_LIMIT:
+                self._cse.clear()
+                self._cse_reads.clear()
+                self._cse_readers.clear()
+            reads = left_reads | right_reads
+            self._cse[key] = result
+            self._cse_reads[result] = reads
+            for name in reads:
+                self._cse_readers.setdefault(name, set()).add(key)
         return result
     
     def gen_assignment(self, target: Node, value: Node) -> Expression:
@@ -108,6 +191,9 @@ class InstructionGenerator:
         result.merge_code(rval.code)
         result.add_instruction(f"{lval.value} = {rval.value}")
         result.result = lval
+        
+        # Subexpressions computed from the old value must not be reused
+        self._cse_evict(lval.value)
         return result
 
 def main():
@@ -123,7 +209,7 @@ def main():
     five = Node(NodeType.CONSTANT, "5")
     result = gen.gen_assignment(x, five)
     print("Generated code:")
-    for instr in result.code:
+    for instr in result.flatten():
         print(f"  {instr}")
     
     # Test Case 2: Complex expression with temporaries
@@ -142,7 +228,19 @@ def main():
     result = gen.gen_assignment(y, add)
     
     print("Generated code:")
-    for instr in result.code:
+    for instr in result.flatten():
+        print(f"  {instr}")
+    
+    # Test Case 3: An assignment between two uses of the same subexpression
+    print("\nTest Case 3: Reassignment between uses (x = a + b; a = 5; y = a + b)")
+    print("-" * 40)
+    program = Expression()
+    program.merge_code(tuple(gen.gen_assignment(x, gen.gen_binary_op(a, "+", b)).code))
+    program.merge_code(tuple(gen.gen_assignment(a, five).code))
+    program.merge_code(tuple(gen.gen_assignment(y, gen.gen_binary_op(a, "+", b)).code))
+    
+    print("Generated code:")
+    for instr in program.flatten():
         print(f"  {instr}")
 
 if __name__ == "__main__":